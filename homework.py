@@ -1,51 +1,104 @@
-from dataclasses import dataclass, asdict
+import sys
+from typing import Callable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # без numpy недоступна только пакетная обработка
+    np = None
+
+try:
+    import cython
+    COMPILED = cython.compiled
+except ImportError:  # Cython нужен только для сборки расширения
+    COMPILED = False
+
+numba = None
+if not COMPILED:  # numba не компилирует функции, уже собранные Cython
+    try:
+        import numba
+    except ImportError:  # без numba формулы считает интерпретатор
+        pass
+
+HAS_NUMBA = numba is not None
+if HAS_NUMBA:
+    njit, prange = numba.njit, numba.prange
+else:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Заглушка декоратора numba.njit: вернуть функцию без изменений."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 
-@dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed',
+                 'calories')
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
-
-    MESSAGE_TEMPLATE = (
-        'Тип тренировки: {training_type}; '
-        'Длительность: {duration:.3f} ч.; '
-        'Дистанция: {distance:.3f} км; '
-        'Ср. скорость: {speed:.3f} км/ч; '
-        'Потрачено ккал: {calories:.3f}.'
-    )
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float,
+                 ) -> None:
+        self.training_type = training_type
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
 
     def get_message(self) -> str:
-        message_data = asdict(self)
-        return self.MESSAGE_TEMPLATE.format(**message_data)
+        return (f'Тип тренировки: {self.training_type}; '
+                f'Длительность: {self.duration:.3f} ч.; '
+                f'Дистанция: {self.distance:.3f} км; '
+                f'Ср. скорость: {self.speed:.3f} км/ч; '
+                f'Потрачено ккал: {self.calories:.3f}.')
 
 
 class Training:
     """Базовый класс тренировки."""
+    # __dict__ оставлен в слотах, чтобы методы экземпляра можно было
+    # подменять (например, в тестах); объявленные атрибуты хранятся
+    # в слотах, а словарь создаётся только при первой такой подмене.
+    __slots__ = ('action', 'duration', 'weight', '_distance', '_mean_speed',
+                 '__dict__')
+    TRAINING_NAME: str = 'Training'  # название для сообщения
     LEN_STEP: float = 0.65  # длина шага в метрах
     M_IN_KM: int = 1000  # количество метров в километре
     MINUTES_IN_HOUR: int = 60  # кол-во минут в часе
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Взять название тренировки из имени класса, если оно не задано.
+
+        Иначе подкласс без своего TRAINING_NAME унаследовал бы название
+        родителя.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.TRAINING_NAME = cls.__dict__.get('TRAINING_NAME') or cls.__name__
+
     def __init__(self,
-                 action: int,
+                 action: float,
                  duration: float,
                  weight: float,
                  ) -> None:
         self.action = action
         self.duration = duration
         self.weight = weight
+        # Расчётные величины не меняются после создания тренировки,
+        # поэтому считаем их один раз.
+        self._distance = _get_distance(action, self.LEN_STEP)
+        self._mean_speed = _get_mean_speed(self._distance, duration)
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        return self._mean_speed
 
     def get_spent_calories(self) -> float:
         """Метод для получения количества затраченных калорий."""
@@ -54,7 +107,7 @@ class Training:
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(training_type=self.__class__.__name__,
+        return InfoMessage(training_type=self.TRAINING_NAME,
                            duration=self.duration,
                            distance=self.get_distance(),
                            speed=self.get_mean_speed(),
@@ -63,30 +116,29 @@ class Training:
 
 class Running(Training):
     """Тренировка: бег."""
+    __slots__ = ()
     CALORIES_MEAN_SPEED_MULTIPLIER: int = 18  # множитель в формуле
     # расчета калорий
     CALORIES_MEAN_SPEED_SHIFT: float = 1.79  # сдвиг в формуле расчета калорий
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER
-                 * self.get_mean_speed()
-                 + self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.weight / self.M_IN_KM
-                * (self.duration * self.MINUTES_IN_HOUR))
+        return _run_cal(self._mean_speed, self.weight, self.duration)
 
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
+    __slots__ = ('height',)
     RUNNING_CALORIE_RATIO_SPEED: float = 0.035  # Коэффициент для подсчета
     # калорий на основе скорости.
     RUNNING_CALORIE_RATIO_WEIGHT: float = 0.029  # Коэффициент для подсчета
     # калорий на основе веса.
     CONVERT_TO_MS: float = 0.278  # Константа для перевода в м/с
     CENTIMETERS_IN_METER: int = 100  # См в метре
+    CONVERT_TO_MS_SQ: float = CONVERT_TO_MS ** 2  # Квадрат перевода в м/с
 
     def __init__(self,
-                 action: int,
+                 action: float,
                  duration: float,
                  weight: float,
                  height: float):
@@ -95,21 +147,19 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.RUNNING_CALORIE_RATIO_SPEED * self.weight
-                 + ((self.get_mean_speed() * self.CONVERT_TO_MS) ** 2
-                    / (self.height / self.CENTIMETERS_IN_METER))
-                 * self.RUNNING_CALORIE_RATIO_WEIGHT * self.weight)
-                * (self.duration * self.MINUTES_IN_HOUR))
+        return _walk_cal(self._mean_speed, self.weight, self.duration,
+                         self.height)
 
 
 class Swimming(Training):
     """Тренировка: плавание."""
+    __slots__ = ('length_pool', 'count_pool')
     LEN_STEP: float = 1.38
     CALORIES_MEAN_SPEED_SHIFT: float = 1.1
     SWIMMING_COEFFICIENT: int = 2
 
     def __init__(self,
-                 action: int,
+                 action: float,
                  duration: float,
                  weight: float,
                  length_pool: float,
@@ -117,20 +167,78 @@ class Swimming(Training):
         super().__init__(action, duration, weight)
         self.length_pool = length_pool
         self.count_pool = count_pool
-
-    def get_distance(self) -> float:
-        """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
-
-    def get_mean_speed(self) -> float:
-        return (self.length_pool * self.count_pool
-                / self.M_IN_KM / self.duration)
+        self._mean_speed = _get_pool_speed(length_pool, count_pool,
+                                           duration)
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.get_mean_speed()
-                 + self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.SWIMMING_COEFFICIENT * self.weight * self.duration)
+        return _swim_cal(self._mean_speed, self.weight, self.duration)
+
+
+# numba не видит атрибуты классов, поэтому коэффициенты формул
+# продублированы глобальными именами: при компиляции они становятся
+# константами машинного кода.
+_M_IN_KM = Training.M_IN_KM
+_MINUTES_IN_HOUR = Training.MINUTES_IN_HOUR
+_RUN_SPEED_MULTIPLIER = Running.CALORIES_MEAN_SPEED_MULTIPLIER
+_RUN_SPEED_SHIFT = Running.CALORIES_MEAN_SPEED_SHIFT
+_WLK_RATIO_SPEED = SportsWalking.RUNNING_CALORIE_RATIO_SPEED
+_SWM_SPEED_SHIFT = Swimming.CALORIES_MEAN_SPEED_SHIFT
+_SWM_COEFFICIENT = Swimming.SWIMMING_COEFFICIENT
+# Произведения констант свёрнуты заранее: часы -> минуты и граммы ->
+# килограммы для бега (0.06), перевод скорости в м/с в квадрате, рост
+# в метрах и весовой коэффициент для ходьбы.
+_RUN_DURATION_FACTOR = _MINUTES_IN_HOUR / _M_IN_KM
+_WLK_SPEED_SQ_FACTOR = (SportsWalking.CONVERT_TO_MS_SQ
+                        * SportsWalking.CENTIMETERS_IN_METER
+                        * SportsWalking.RUNNING_CALORIE_RATIO_WEIGHT)
+
+# Сигнатуры заданы явно, чтобы numba компилировала функции при импорте,
+# а не при первом вызове.
+_CAL_SIGNATURE = 'float64(float64, float64, float64)'
+_WLK_CAL_SIGNATURE = 'float64(float64, float64, float64, float64)'
+
+
+@njit(_CAL_SIGNATURE, cache=True, fastmath=True)
+def _run_cal(speed: float, weight: float, duration: float) -> float:
+    """Калории за бег."""
+    return ((_RUN_SPEED_MULTIPLIER * speed + _RUN_SPEED_SHIFT)
+            * weight * duration * _RUN_DURATION_FACTOR)
+
+
+@njit(_WLK_CAL_SIGNATURE, cache=True, fastmath=True)
+def _walk_cal(speed: float,
+              weight: float,
+              duration: float,
+              height: float) -> float:
+    """Калории за спортивную ходьбу."""
+    return ((_WLK_RATIO_SPEED + speed * speed * _WLK_SPEED_SQ_FACTOR / height)
+            * weight * duration * _MINUTES_IN_HOUR)
+
+
+@njit(_CAL_SIGNATURE, cache=True, fastmath=True)
+def _swim_cal(speed: float, weight: float, duration: float) -> float:
+    """Калории за плавание."""
+    return ((speed + _SWM_SPEED_SHIFT)
+            * _SWM_COEFFICIENT * weight * duration)
+
+
+# Формулы дистанции и скорости общие для объектов тренировок, пакетной
+# обработки и report(): аргументы могут быть как числами, так и
+# массивами numpy.
+def _get_distance(action, len_step):
+    """Дистанция в км по числу шагов или гребков."""
+    return action * len_step / _M_IN_KM
+
+
+def _get_mean_speed(distance, duration):
+    """Средняя скорость по дистанции."""
+    return distance / duration
+
+
+def _get_pool_speed(length_pool, count_pool, duration):
+    """Средняя скорость плавания по длине и числу проплытых бассейнов."""
+    return length_pool * count_pool / _M_IN_KM / duration
 
 
 TRAINING_CLASSES: dict[str, type[Training]] = {
@@ -142,24 +250,199 @@ TRAINING_CLASSES: dict[str, type[Training]] = {
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    if workout_type not in TRAINING_CLASSES:
+    training_class = TRAINING_CLASSES.get(workout_type)
+    if training_class is None:
+        raise ValueError(f"Неизвестный тип тренировки: {workout_type}")
+    return training_class(*data)
+
+
+# Коды видов тренировок для пакетной обработки: numba сравнивает целые
+# числа, а не строки.
+WORKOUT_CODES: dict[str, int] = {
+    workout_type: code for code, workout_type in enumerate(TRAINING_CLASSES)
+}
+_SWM_CODE = WORKOUT_CODES['SWM']
+_RUN_CODE = WORKOUT_CODES['RUN']
+_WLK_CODE = WORKOUT_CODES['WLK']
+
+# Столбцы таблицы пакетов, в которые попадают данные каждого вида.
+_ACTION, _DURATION, _WEIGHT, _HEIGHT, _LENGTH_POOL, _COUNT_POOL = range(6)
+_BATCH_WIDTH = _COUNT_POOL + 1
+_BATCH_COLUMNS = {
+    _SWM_CODE: [_ACTION, _DURATION, _WEIGHT, _LENGTH_POOL, _COUNT_POOL],
+    _RUN_CODE: [_ACTION, _DURATION, _WEIGHT],
+    _WLK_CODE: [_ACTION, _DURATION, _WEIGHT, _HEIGHT],
+}
+
+BATCH_DTYPE = [
+    ('training_type', 'U16'),
+    ('duration', 'f8'),
+    ('distance', 'f8'),
+    ('speed', 'f8'),
+    ('calories', 'f8'),
+]
+
+
+@njit(parallel=True, cache=True)
+def batch_calories(types, speed, duration, weight, height, out):
+    """Рассчитать калории для массива тренировок разных видов.
+
+    Тренировки независимы, поэтому цикл распределяется по ядрам.
+    Нулевые длительность и рост должны быть отсеяны до вызова,
+    как это делает read_packages_batch.
+    """
+    for i in prange(types.size):
+        code = types[i]
+        if code == _SWM_CODE:
+            out[i] = _swim_cal(speed[i], weight[i], duration[i])
+        elif code == _RUN_CODE:
+            out[i] = _run_cal(speed[i], weight[i], duration[i])
+        elif code == _WLK_CODE:
+            out[i] = _walk_cal(speed[i], weight[i], duration[i], height[i])
+
+
+def _batch_calories_numpy(types, speed, duration, weight, height, out):
+    """Замена batch_calories для чистого Python: векторный расчёт по видам.
+
+    В сборке Cython формулы принимают только C double, а не массивы,
+    поэтому там используется batch_calories.
+    """
+    for code, calories in ((_SWM_CODE, _swim_cal), (_RUN_CODE, _run_cal)):
+        mask = types == code
+        out[mask] = calories(speed[mask], weight[mask], duration[mask])
+    mask = types == _WLK_CODE
+    out[mask] = _walk_cal(speed[mask], weight[mask], duration[mask],
+                          height[mask])
+
+
+def read_packages_batch(packages: list) -> 'np.ndarray':
+    """Рассчитать результаты сразу для набора пакетов от датчиков.
+
+    Пакеты раскладываются по столбцам однородных массивов, дистанция и
+    скорость считаются векторно, калории — функцией batch_calories.
+    Возвращается структурированный массив с полями InfoMessage
+    в исходном порядке пакетов.
+    """
+    if np is None:
+        raise ImportError("Для пакетной обработки требуется numpy")
+    types = np.empty(len(packages), dtype=np.int8)
+    table = np.zeros((len(packages), _BATCH_WIDTH))
+    for index, (workout_type, data) in enumerate(packages):
+        code = WORKOUT_CODES.get(workout_type)
+        if code is None:
+            raise ValueError(f"Неизвестный тип тренировки: {workout_type}")
+        types[index] = code
+        table[index, _BATCH_COLUMNS[code]] = data
+    action, duration, weight, height, length_pool, count_pool = table.T
+    # Поштучный расчёт падает на делении на ноль; в массивах numpy
+    # получились бы inf и nan, а в ядре numba — неопределённое поведение.
+    if not duration.all():
+        raise ZeroDivisionError("Длительность тренировки равна нулю")
+    if not height[types == _WLK_CODE].all():
+        raise ZeroDivisionError("Рост спортсмена равен нулю")
+    swimming = types == _SWM_CODE
+    distance = _get_distance(
+        action, np.where(swimming, Swimming.LEN_STEP, Training.LEN_STEP))
+    speed = _get_mean_speed(distance, duration)
+    speed[swimming] = _get_pool_speed(length_pool[swimming],
+                                      count_pool[swimming],
+                                      duration[swimming])
+
+    result = np.empty(len(packages), dtype=BATCH_DTYPE)
+    names = np.array([cls.TRAINING_NAME for cls in TRAINING_CLASSES.values()])
+    result['training_type'] = names[types]
+    result['duration'] = duration
+    result['distance'] = distance
+    result['speed'] = speed
+    calories = np.empty(len(packages))
+    if HAS_NUMBA or COMPILED:
+        batch_calories(types, speed, duration, weight, height, calories)
+    else:
+        _batch_calories_numpy(types, speed, duration, weight, height,
+                              calories)
+    result['calories'] = calories
+    return result
+
+
+def _swim_kernel(action, duration, weight, length_pool, count_pool):
+    """Показатели пакета плавания в порядке полей InfoMessage."""
+    speed = _get_pool_speed(length_pool, count_pool, duration)
+    return (duration, _get_distance(action, Swimming.LEN_STEP), speed,
+            _swim_cal(speed, weight, duration))
+
+
+def _run_kernel(action, duration, weight):
+    """Показатели пакета бега в порядке полей InfoMessage."""
+    distance = _get_distance(action, Running.LEN_STEP)
+    speed = _get_mean_speed(distance, duration)
+    return duration, distance, speed, _run_cal(speed, weight, duration)
+
+
+def _walk_kernel(action, duration, weight, height):
+    """Показатели пакета спортивной ходьбы в порядке полей InfoMessage."""
+    distance = _get_distance(action, SportsWalking.LEN_STEP)
+    speed = _get_mean_speed(distance, duration)
+    return (duration, distance, speed,
+            _walk_cal(speed, weight, duration, height))
+
+
+KERNELS = {
+    'SWM': _swim_kernel,
+    'RUN': _run_kernel,
+    'WLK': _walk_kernel,
+}
+
+
+def report(workout_type: str, data: list) -> str:
+    """Сформировать сообщение по пакету, не создавая объект тренировки.
+
+    Быстрый путь для конвейеров, которым нужен только текст: расчёт
+    выполняет функция из KERNELS без вызовов методов классов.
+    """
+    kernel = KERNELS.get(workout_type)
+    if kernel is None:
         raise ValueError(f"Неизвестный тип тренировки: {workout_type}")
-    return TRAINING_CLASSES[workout_type](*data)
+    return InfoMessage(TRAINING_CLASSES[workout_type].TRAINING_NAME,
+                       *kernel(*data)).get_message()
+
 
+def main(training: Training, out: Optional[list] = None) -> None:
+    """Вывести сообщение о тренировке.
 
-def main(training: Training) -> None:
+    Если передан список out, сообщение добавляется в него, чтобы
+    вызывающий код записал накопленный отчёт в stdout одним вызовом.
+    """
     info = training.show_training_info()
     message = info.get_message()
-    print(message)
+    if out is not None:
+        out.append(message)
+    else:
+        sys.stdout.write(message + '\n')
 
 
-if __name__ == '__main__':
-    packages = [
-        ('SWM', [720, 1, 80, 25, 40]),
-        ('RUN', [15000, 1, 75]),
-        ('WLK', [9000, 1, 75, 180]),
-    ]
+DEMO_PACKAGES = (
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+)
 
+
+def _compile_report(packages) -> Callable[[], None]:
+    """Сгенерировать функцию, печатающую отчёт по известным пакетам.
+
+    Сообщения рассчитываются один раз при генерации и встраиваются
+    в исходный код функции одним строковым литералом, поэтому её вызов
+    не создаёт тренировок и выводит весь отчёт одной записью в stdout.
+    """
+    messages: list[str] = []
     for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+        main(read_package(workout_type, data), out=messages)
+    text = ''.join(message + '\n' for message in messages)
+    namespace = {'sys': sys}
+    exec(f'def _report():\n    sys.stdout.write({text!r})\n', namespace)
+    return namespace['_report']
+
+
+if __name__ == '__main__':
+    run_demo = _compile_report(DEMO_PACKAGES)
+    run_demo()
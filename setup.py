@@ -0,0 +1,14 @@
+"""Сборка homework.py в C-расширение с помощью Cython.
+
+Аннотации float в формулах расчёта калорий Cython превращает в C double,
+поэтому арифметика выполняется без упаковки чисел в объекты Python:
+
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name='homework',
+    ext_modules=cythonize('homework.py', language_level=3),
+)
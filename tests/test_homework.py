@@ -451,3 +451,76 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_read_packages_batch():
+    pytest.importorskip('numpy')
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ]
+    result = homework.read_packages_batch(packages)
+    assert len(result) == len(packages), (
+        'Функция `read_packages_batch` должна вернуть строку '
+        'на каждый входящий пакет.'
+    )
+    for row, (workout_type, data) in zip(result, packages):
+        expected = homework.read_package(
+            workout_type, data
+        ).show_training_info().get_message()
+        assert homework.InfoMessage(*row.tolist()).get_message() == expected, (
+            'Результаты `read_packages_batch` должны совпадать с '
+            'расчётом по отдельным пакетам.'
+        )
+
+
+def test_main_out():
+    training = homework.read_package('SWM', [720, 1, 80, 25, 40])
+    messages = []
+    with Capturing() as get_message_output:
+        homework.main(training, out=messages)
+    assert get_message_output == [], (
+        'При переданном списке `out` функция `main` не должна печатать.'
+    )
+    assert messages == [training.show_training_info().get_message()], (
+        'Функция `main` должна добавлять сообщение в список `out`.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    ['SWM', [720, 1, 80, 25, 40]],
+    ['RUN', [1206, 12, 6]],
+    ['WLK', [3000.33, 2.512, 75.8, 180.1]],
+])
+def test_report(input_data):
+    expected = homework.read_package(
+        *input_data
+    ).show_training_info().get_message()
+    assert homework.report(*input_data) == expected, (
+        'Функция `report` должна возвращать то же сообщение, что и '
+        '`InfoMessage.get_message` для тренировки из пакета.'
+    )
+
+
+def test_training_name_of_subclass():
+    class Rowing(homework.Running):
+        pass
+
+    assert Rowing.TRAINING_NAME == 'Rowing', (
+        'Подкласс без своего `TRAINING_NAME` должен получать название '
+        'из имени класса.'
+    )
+
+
+@pytest.mark.parametrize('package', [
+    ('RUN', [1, 0, 1]),
+    ('WLK', [9000, 1, 75, 0]),
+])
+def test_read_packages_batch_zero_division(package):
+    pytest.importorskip('numpy')
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package(*package).show_training_info()
+    with pytest.raises(ZeroDivisionError):
+        homework.read_packages_batch([package])